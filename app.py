@@ -7,21 +7,20 @@ by conference, year, keywords, and review scores.
 """
 
 import streamlit as st
-from typing import List, Dict, Any
-import importlib
-
-# Force reload modules to handle hot-reloading issues
-import config
-import ui_components
-import openreview_client
-import parsing
-importlib.reload(config)
-importlib.reload(ui_components)
-importlib.reload(openreview_client)
-importlib.reload(parsing)
+import numpy as np
+import pandas as pd
+from typing import List, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
 
 from parsing import (
+    HYPERSCAN_MIN_KEYWORDS,
+    HYPERSCAN_MIN_TEXTS,
+    compute_all_paper_stats,
     filter_paper_by_keywords,
+    match_texts_automaton,
+    match_texts_hyperscan,
+    score_filter_mask,
     sort_papers,
 )
 from ui_components import (
@@ -77,6 +76,10 @@ def init_session_state():
         st.session_state.papers = []
     if "filtered_papers" not in st.session_state:
         st.session_state.filtered_papers = []
+    if "papers_df" not in st.session_state:
+        st.session_state.papers_df = None
+    if "score_cols" not in st.session_state:
+        st.session_state.score_cols = None
     if "current_page" not in st.session_state:
         st.session_state.current_page = 0
     if "data_loaded" not in st.session_state:
@@ -85,6 +88,10 @@ def init_session_state():
         st.session_state.load_status = ""
     if "last_filters" not in st.session_state:
         st.session_state.last_filters = {}
+    if "dataset_version" not in st.session_state:
+        st.session_state.dataset_version = 0
+    if "filter_memo" not in st.session_state:
+        st.session_state.filter_memo = {}
 
 
 init_session_state()
@@ -94,87 +101,102 @@ init_session_state()
 # DATA LOADING
 # ============================================================================
 
+def _fetch_venue_papers(venue_ids: List[str]) -> List[Dict[str, Any]]:
+    """
+    Try venue ID candidates in order, returning the first non-empty result.
+    Runs inside a worker thread; must not touch Streamlit UI elements.
+    """
+    from openreview_client import fetch_submissions_with_reviews
+
+    for vid in venue_ids:
+        fetched_papers, _ = fetch_submissions_with_reviews(vid)
+        if fetched_papers:
+            return fetched_papers
+    return []
+
+
 def load_data(filters: Dict[str, Any]) -> None:
     """
     Load papers based on filter settings.
+    Venues are fetched concurrently (network-bound), so total wall time is
+    roughly the slowest venue instead of the sum of all venues.
     Uses staged progress display for better user feedback.
     """
     # Determine what to load
     venues_to_load = []
-    
+
     if filters["custom_venue"]:
         venues_to_load.append(("custom", filters["custom_venue"]))
     else:
         for venue in filters["venues"]:
             for year in range(filters["year_start"], filters["year_end"] + 1):
                 venues_to_load.append((venue, year))
-    
+
     if not venues_to_load:
         st.warning("请选择至少一个会议或输入自定义 Venue ID")
         return
-    
-    all_papers = []
+
+    per_venue_papers: List[List[Dict[str, Any]]] = []
     status_messages = []
     total_tasks = len(venues_to_load)
-    
+
     # Import needed modules
-    from openreview_client import fetch_submissions_with_reviews
     from config import get_venue_id_candidates as get_candidates
-    
+
+    # Build one task per venue/year: (display name, venue label, year, ID candidates)
+    tasks = []
+    for item in venues_to_load:
+        if item[0] == "custom":
+            venue_display = item[1]
+            tasks.append((venue_display, item[1], filters["year_start"], [item[1]]))
+        else:
+            venue, year = item
+            venue_display = f"{venue} {year}"
+            tasks.append((venue_display, venue, year, get_candidates(venue, year)))
+
     # Use st.status for staged progress display
     with st.status("📡 正在加载数据（包含评审，约需 2-3 分钟）...", expanded=True) as status:
-        
-        for task_idx, item in enumerate(venues_to_load):
-            if item[0] == "custom":
-                venue_display = item[1]
-                venue_id = item[1]
-                year = filters["year_start"]
-            else:
-                venue, year = item
-                venue_display = f"{venue} {year}"
-                venue_id = None
-            
-            # Stage 1
-            st.write(f"🔗 **[{task_idx + 1}/{total_tasks}] {venue_display}**")
-            
-            # Get venue ID candidates
-            if venue_id:
-                venue_ids = [venue_id]
-            else:
-                venue_ids = get_candidates(venue, year)
-            
-            papers = []
-            success = False
-            
-            for vid in venue_ids:
-                # Fetch submissions WITH reviews
-                st.write(f"📄 获取论文和评审数据（请耐心等待）...")
-                fetched_papers, fetch_status = fetch_submissions_with_reviews(vid)
-                
-                if fetched_papers:
+        st.write(f"🔗 并行获取 **{total_tasks}** 个数据源的论文和评审数据（请耐心等待）...")
+
+        with ThreadPoolExecutor(max_workers=min(8, total_tasks)) as executor:
+            future_to_task = {
+                executor.submit(_fetch_venue_papers, venue_ids): (venue_display, venue_label, year)
+                for venue_display, venue_label, year, venue_ids in tasks
+            }
+
+            done_count = 0
+            for future in as_completed(future_to_task):
+                venue_display, venue_label, year = future_to_task[future]
+                done_count += 1
+
+                try:
+                    papers = future.result()
+                except Exception as e:
+                    papers = []
+                    st.write(f"❌ **[{done_count}/{total_tasks}] {venue_display}** - 加载失败: {e}")
+                    status_messages.append(f"{venue_display}: 加载失败")
+                    continue
+
+                if papers:
                     # Add year/venue info
-                    for paper in fetched_papers:
+                    for paper in papers:
                         paper["year"] = year
-                        paper["venue"] = venue if not venue_id else venue_id
-                    
-                    papers = fetched_papers
-                    
-                    reviewed_count = sum(1 for p in papers if p.get("scored_review_count", 0) > 0)
-                    st.write(f"✅ 找到 **{len(papers)}** 篇论文（{reviewed_count} 篇有评审）")
-                    status_msg = f"{venue_display}: {len(papers)} 篇论文 ({reviewed_count} 有评审)"
-                    status_messages.append(status_msg)
-                    success = True
-                    break
-            
-            if not success:
-                st.write(f"⚠️ **{venue_display}** - 未找到数据")
-                status_messages.append(f"{venue_display}: 未找到数据")
-            
-            all_papers.extend(papers)
-        
+                        paper["venue"] = venue_label
+
+                    reviewed_count = sum(p["scored_review_count"] > 0 for p in papers)
+                    st.write(f"✅ **[{done_count}/{total_tasks}] {venue_display}** - 找到 **{len(papers)}** 篇论文（{reviewed_count} 篇有评审）")
+                    status_messages.append(f"{venue_display}: {len(papers)} 篇论文 ({reviewed_count} 有评审)")
+                    per_venue_papers.append(papers)
+                else:
+                    st.write(f"⚠️ **[{done_count}/{total_tasks}] {venue_display}** - 未找到数据")
+                    status_messages.append(f"{venue_display}: 未找到数据")
+
+        # Flatten once instead of repeatedly growing one list
+        all_papers = list(chain.from_iterable(per_venue_papers))
+
         # Final status
         if all_papers:
-            reviewed_total = sum(1 for p in all_papers if p.get("scored_review_count", 0) > 0)
+            reviewed_total = sum(p["scored_review_count"] > 0 for p in all_papers)
             status.update(
                 label=f"✅ 加载完成！{len(all_papers)} 篇论文（{reviewed_total} 篇有评审）",
                 state="complete",
@@ -183,27 +205,228 @@ def load_data(filters: Dict[str, Any]) -> None:
         else:
             status.update(label="❌ 未能加载任何论文", state="error")
     
-    # Update session state
+    # Update session state. Score stats are re-derived in one vectorized
+    # batch pass so every source (API, scraper, disk cache) is consistent.
+    compute_all_paper_stats(all_papers)
     st.session_state.papers = all_papers
+    st.session_state.papers_df = build_papers_dataframe(all_papers)
+    st.session_state.score_cols = build_score_columns(st.session_state.papers_df)
+
+    # Dataset-wide max score for the adaptive UI, reduced once per load so
+    # reruns just read the scalar
+    max_score_dataset = 10.0  # Default assumption
+    if st.session_state.score_cols:
+        max_scores = st.session_state.score_cols["max_score"]
+        valid_max_scores = max_scores[~np.isnan(max_scores)]
+        if valid_max_scores.size:
+            max_score_dataset = float(valid_max_scores.max())
+    st.session_state.max_score_dataset = max_score_dataset
+
+    # New dataset: bump the version so memoized filter results go stale
+    st.session_state.dataset_version = st.session_state.get("dataset_version", 0) + 1
+    st.session_state.filter_memo = {}
+
     st.session_state.data_loaded = True
     st.session_state.load_status = "\n".join(status_messages)
     st.session_state.current_page = 0
 
 
+def build_papers_dataframe(papers: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Build a columnar view of the loaded papers for vectorized filtering.
+    Text columns are lowercased once here so filter reruns don't redo it.
+    """
+    if not papers:
+        return pd.DataFrame()
+
+    df = pd.DataFrame({
+        "title": [p.get("title") or "" for p in papers],
+        "abstract": [p.get("abstract") or "" for p in papers],
+        "avg_score": [p.get("avg_score") for p in papers],
+        "max_score": [p.get("max_score") for p in papers],
+        "scored_review_count": [p.get("scored_review_count", 0) for p in papers],
+        "avg_confidence": [p.get("avg_confidence") for p in papers],
+        "year": [p.get("year") for p in papers],
+    })
+    # Reuse the lowercase text computed at ingest when available
+    df["_title_lc"] = [p.get("_title_lc") or (p.get("title") or "").lower() for p in papers]
+    df["_abstract_lc"] = [p.get("_abstract_lc") or (p.get("abstract") or "").lower() for p in papers]
+    return df
+
+
+def build_score_columns(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """
+    Extract the numeric paper columns as parallel NumPy arrays (SoA layout)
+    so score filters and dataset-wide reductions run as C-level vector ops.
+    """
+    if df.empty:
+        return {}
+    return {
+        "avg_score": df["avg_score"].to_numpy(dtype=np.float64),
+        "max_score": df["max_score"].to_numpy(dtype=np.float64),
+        "scored_review_count": df["scored_review_count"].to_numpy(),
+        "avg_confidence": df["avg_confidence"].to_numpy(dtype=np.float64),
+    }
+
+
+def _keyword_mask(text_col: pd.Series, keywords: List[str], logic: str) -> np.ndarray:
+    """
+    Vectorized equivalent of match_keywords over a lowercase text column.
+    Empty text matches everything, mirroring match_keywords.
+    For 3+ keywords, a cached Aho-Corasick automaton scans each text once
+    instead of running one substring pass per keyword.
+    """
+    keywords_lower = [kw.lower() for kw in keywords]
+    empty_mask = (text_col == "").to_numpy()
+
+    # Very large corpus with many keywords: hyperscan's SIMD DFA, when
+    # installed, beats both the automaton and per-keyword scans
+    if (
+        len(keywords_lower) > HYPERSCAN_MIN_KEYWORDS
+        and len(text_col) > HYPERSCAN_MIN_TEXTS
+    ):
+        matches = match_texts_hyperscan(text_col.to_numpy(), keywords_lower, logic)
+        if matches is not None:
+            return np.asarray(matches, dtype=bool) | empty_mask
+
+    if len(keywords_lower) > 2:
+        matches = match_texts_automaton(text_col.to_numpy(), keywords_lower, logic)
+        if matches is not None:
+            return np.asarray(matches, dtype=bool) | empty_mask
+
+    kw_masks = [text_col.str.contains(kw, regex=False).to_numpy() for kw in keywords_lower]
+    if logic.upper() == "AND":
+        combined = np.logical_and.reduce(kw_masks)
+    else:  # OR
+        combined = np.logical_or.reduce(kw_masks)
+    return combined | empty_mask
+
+
+def _filter_signature(filters: Dict[str, Any]) -> Tuple:
+    """
+    Hashable key for the filter settings that affect which papers survive.
+    Sort order and pagination are deliberately excluded so changing them
+    doesn't invalidate a memoized filter result.
+    """
+    return (
+        tuple(filters["keywords"]),
+        filters["field_scope"],
+        filters["keyword_logic"],
+        filters.get("only_reviewed", False),
+        filters.get("min_avg_score"),
+        filters.get("min_max_score"),
+        filters.get("min_review_count"),
+        filters.get("min_confidence"),
+    )
+
+
 def apply_filters(papers: List[Dict[str, Any]], filters: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     Apply keyword and score filters to papers.
+    Uses the cached DataFrame from load_data for vectorized boolean masks;
+    falls back to the per-paper loop if the DataFrame is unavailable.
+    Filter and sort results are memoized per dataset version, so reruns
+    triggered by unrelated widgets (pagination, page size) skip both.
     """
+    # Empty load: papers_df is a column-less frame, so the mask path
+    # would KeyError on the score columns
+    if not papers:
+        return []
+
+    df = st.session_state.get("papers_df")
+    if df is None or len(df) != len(papers):
+        return _apply_filters_loop(papers, filters)
+
+    memo = st.session_state.setdefault("filter_memo", {})
+    version = st.session_state.get("dataset_version", 0)
+    signature = _filter_signature(filters)
+
+    order_key = ("order", version, signature, filters["sort_by"])
+    ordered = memo.get(order_key)
+    if ordered is not None:
+        return [papers[i] for i in ordered]
+
+    filter_key = ("rows", version, signature)
+    row_positions = memo.get(filter_key)
+    if row_positions is None:
+        row_positions = np.flatnonzero(_filter_mask(df, filters))
+        if len(memo) > 32:
+            memo.clear()
+        memo[filter_key] = row_positions
+
+    # Sort the surviving rows and map back to the original paper dicts
+    sort_by = filters["sort_by"]
+    sort_col = "_title_lc" if sort_by == "title" else sort_by
+    sub = df.iloc[row_positions]
+    if sort_col in sub.columns:
+        sub = sub.sort_values(sort_col, ascending=False, na_position="last")
+    ordered = sub.index.to_list()
+    memo[order_key] = ordered
+
+    return [papers[i] for i in ordered]
+
+
+def _filter_mask(df: pd.DataFrame, filters: Dict[str, Any]) -> np.ndarray:
+    """Boolean mask of papers surviving the keyword and score filters."""
+    cols = st.session_state.get("score_cols")
+    if not cols or len(cols["avg_score"]) != len(df):
+        cols = build_score_columns(df)
+
+    mask = np.ones(len(df), dtype=bool)
+
+    # Only reviewed filter
+    if filters.get("only_reviewed", False):
+        mask &= cols["scored_review_count"] > 0
+
+    # Keyword filter
+    keywords = filters["keywords"]
+    if keywords:
+        field_scope = filters["field_scope"]
+        logic = filters["keyword_logic"]
+        if field_scope == "title":
+            mask &= _keyword_mask(df["_title_lc"], keywords, logic)
+        elif field_scope == "abstract":
+            mask &= _keyword_mask(df["_abstract_lc"], keywords, logic)
+        elif field_scope == "title_or_abstract":
+            mask &= (
+                _keyword_mask(df["_title_lc"], keywords, logic)
+                | _keyword_mask(df["_abstract_lc"], keywords, logic)
+            )
+        elif field_scope == "title_and_abstract":
+            mask &= (
+                _keyword_mask(df["_title_lc"], keywords, logic)
+                & _keyword_mask(df["_abstract_lc"], keywords, logic)
+            )
+        else:
+            mask &= _keyword_mask(df["_title_lc"] + " " + df["_abstract_lc"], keywords, logic)
+
+    # Score filters (NaN comparisons are False, matching the None semantics)
+    mask &= score_filter_mask(
+        cols["avg_score"],
+        cols["max_score"],
+        cols["scored_review_count"],
+        cols["avg_confidence"],
+        min_avg_score=filters.get("min_avg_score"),
+        min_max_score=filters.get("min_max_score"),
+        min_review_count=filters.get("min_review_count"),
+        min_confidence=filters.get("min_confidence"),
+    )
+
+    return mask
+
+
+def _apply_filters_loop(papers: List[Dict[str, Any]], filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Per-paper fallback filter path (original implementation)."""
     from parsing import filter_paper_by_scores
-    
+
     filtered = []
-    
+
     for paper in papers:
         # Only reviewed filter
         if filters.get("only_reviewed", False):
             if paper.get("scored_review_count", 0) == 0:
                 continue
-        
+
         # Keyword filter
         if not filter_paper_by_keywords(
             paper,
@@ -212,7 +435,7 @@ def apply_filters(papers: List[Dict[str, Any]], filters: Dict[str, Any]) -> List
             filters["keyword_logic"]
         ):
             continue
-        
+
         # Score filters
         if not filter_paper_by_scores(
             paper,
@@ -222,12 +445,12 @@ def apply_filters(papers: List[Dict[str, Any]], filters: Dict[str, Any]) -> List
             min_confidence=filters.get("min_confidence"),
         ):
             continue
-        
+
         filtered.append(paper)
-    
+
     # Sort
     sorted_papers = sort_papers(filtered, filters["sort_by"], ascending=False)
-    
+
     return sorted_papers
 
 
@@ -235,6 +458,46 @@ def apply_filters(papers: List[Dict[str, Any]], filters: Dict[str, Any]) -> List
 # MAIN APP
 # ============================================================================
 
+# st.fragment landed in Streamlit 1.33; degrade to a plain function call
+# (full-script reruns) on older installs
+_fragment = getattr(st, "fragment", getattr(st, "experimental_fragment", lambda f: f))
+
+
+@_fragment
+def _results_view(filters: Dict[str, Any]) -> None:
+    """
+    Filter, summarize and render the loaded papers.
+    Runs as a fragment: interactions inside it (pagination buttons, CSV
+    download) rerun only this subtree instead of the whole script.
+    """
+    # Apply filters to loaded papers
+    filtered_papers = apply_filters(st.session_state.papers, filters)
+    st.session_state.filtered_papers = filtered_papers
+
+    # Filter summary
+    render_filter_summary(filters, len(filtered_papers), len(st.session_state.papers))
+
+    # Export button
+    col1, col2 = st.columns([3, 1])
+    with col2:
+        if filtered_papers:
+            csv_data = export_papers_to_csv(filtered_papers)
+            st.download_button(
+                label="📥 导出 CSV",
+                data=csv_data,
+                file_name="openreview_papers.csv",
+                mime="text/csv",
+                use_container_width=True,
+            )
+
+    # Paper table
+    render_paper_table(
+        filtered_papers,
+        st.session_state.current_page,
+        filters["page_size"],
+        keywords=filters["keywords"],
+    )
+
 def main():
     """Main application entry point."""
     
@@ -245,27 +508,8 @@ def main():
         unsafe_allow_html=True
     )
     
-    # Calculate dataset statistics for adaptive UI
-    max_score_in_dataset = 10.0  # Default assumption
-    if st.session_state.papers:
-        # Find the absolute maximum score in the loaded dataset
-        # Filter out None values
-        valid_max_scores = [
-            p.get("max_score") 
-            for p in st.session_state.papers 
-            if p.get("max_score") is not None
-        ]
-        
-        if valid_max_scores:
-            max_score_in_dataset = max(valid_max_scores)
-            
-            # If explicit refresh, update session state cache
-            if 'max_score_dataset' not in st.session_state or st.session_state.get('data_loaded', False):
-                st.session_state.max_score_dataset = max_score_in_dataset
-    
-    # Use cached value if available
-    if 'max_score_dataset' in st.session_state:
-        max_score_in_dataset = st.session_state.max_score_dataset
+    # Dataset max score is reduced once in load_data; reruns read the scalar
+    max_score_in_dataset = st.session_state.get("max_score_dataset", 10.0)
 
     # Sidebar filters
     filters = render_sidebar_filters(max_score_in_dataset=max_score_in_dataset)
@@ -287,6 +531,10 @@ def main():
         st.cache_data.clear()
         st.session_state.papers = []
         st.session_state.filtered_papers = []
+        st.session_state.papers_df = None
+        st.session_state.score_cols = None
+        st.session_state.filter_memo = {}
+        st.session_state.pop("max_score_dataset", None)
         st.session_state.data_loaded = False
         st.success("缓存已清除")
         st.rerun()
@@ -324,33 +572,8 @@ def main():
             """)
         return
     
-    # Apply filters to loaded papers
-    filtered_papers = apply_filters(st.session_state.papers, filters)
-    st.session_state.filtered_papers = filtered_papers
-    
-    # Filter summary
-    render_filter_summary(filters, len(filtered_papers), len(st.session_state.papers))
-    
-    # Export button
-    col1, col2 = st.columns([3, 1])
-    with col2:
-        if filtered_papers:
-            csv_data = export_papers_to_csv(filtered_papers)
-            st.download_button(
-                label="📥 导出 CSV",
-                data=csv_data,
-                file_name="openreview_papers.csv",
-                mime="text/csv",
-                use_container_width=True,
-            )
-    
-    # Paper table
-    render_paper_table(
-        filtered_papers,
-        st.session_state.current_page,
-        filters["page_size"],
-        keywords=filters["keywords"],
-    )
+    # Filtered results (fragment: pagination reruns only this subtree)
+    _results_view(filters)
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@ Configuration module for OpenReview Paper Filtering Tool.
 Contains venue mappings and application settings.
 """
 
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 # ============================================================================
@@ -89,25 +90,31 @@ MIN_YEAR = 2018
 MAX_YEAR = 2026
 
 
+# Lowercased alias -> canonical venue key, built once at import time so
+# lookups are a single dict probe instead of an O(venues x aliases) scan
+_ALIAS_INDEX: Dict[str, str] = {
+    alias.lower(): key
+    for key, cfg in VENUE_MAPPINGS.items()
+    for alias in [key, *cfg["aliases"]]
+}
+
+
+@lru_cache(maxsize=None)
 def get_venue_id_candidates(venue_name: str, year: int) -> List[str]:
     """
     Get all possible OpenReview venue IDs for a given venue name and year.
-    
+
     Args:
         venue_name: Conference name (case-insensitive, aliases supported)
         year: The year to query
-        
+
     Returns:
         List of possible venue ID strings to try
     """
-    # Normalize venue name
-    venue_upper = venue_name.upper().strip()
-    
-    # Find matching venue config
-    for key, config in VENUE_MAPPINGS.items():
-        if venue_upper == key.upper() or venue_name.lower() in [a.lower() for a in config["aliases"]]:
-            return [p.format(year=year) for p in config["patterns"]]
-    
+    key = _ALIAS_INDEX.get(venue_name.lower().strip())
+    if key is not None:
+        return [p.format(year=year) for p in VENUE_MAPPINGS[key]["patterns"]]
+
     # If not found in mappings, return the name as-is (custom venue)
     return [venue_name]
 
@@ -117,27 +124,21 @@ def get_available_venues() -> List[str]:
     return list(VENUE_MAPPINGS.keys())
 
 
+@lru_cache(maxsize=None)
 def get_venue_years(venue_name: str) -> List[int]:
     """Get available years for a specific venue."""
-    venue_upper = venue_name.upper().strip()
-    
-    for key, config in VENUE_MAPPINGS.items():
-        if venue_upper == key.upper() or venue_name.lower() in [a.lower() for a in config["aliases"]]:
-            return config["years_available"]
-    
+    key = _ALIAS_INDEX.get(venue_name.lower().strip())
+    if key is not None:
+        return VENUE_MAPPINGS[key]["years_available"]
+
     # Default range for custom venues
     return list(range(MIN_YEAR, MAX_YEAR + 1))
 
 
+@lru_cache(maxsize=None)
 def normalize_venue_name(venue_name: str) -> Optional[str]:
     """
     Normalize venue name to canonical form.
     Returns None if venue not found in mappings.
     """
-    venue_lower = venue_name.lower().strip()
-    
-    for key, config in VENUE_MAPPINGS.items():
-        if venue_lower == key.lower() or venue_lower in [a.lower() for a in config["aliases"]]:
-            return key
-    
-    return None
+    return _ALIAS_INDEX.get(venue_name.lower().strip())
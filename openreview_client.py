@@ -4,15 +4,53 @@ Handles API interactions, caching, and retry logic.
 FIXED: Uses details=replies to get reviews in batch.
 """
 
+import hashlib
+import random
 import time
+from pathlib import Path
+
+import requests
+import numpy as np
+import pandas as pd
 import streamlit as st
 from typing import List, Dict, Any, Optional, Callable, Tuple
 import openreview
+
+# Optional: numba JIT for the numeric score reduction
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Optional: route requests' JSON decoding through orjson so the large
+# details=replies note payloads parse 2-4x faster than with stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    import requests.models
+
+    class _OrjsonShim:
+        """Minimal requests-compatible JSON module backed by orjson."""
+
+        loads = staticmethod(orjson.loads)
+
+        @staticmethod
+        def dumps(obj, **kwargs):
+            # requests passes stdlib-only kwargs (e.g. allow_nan); orjson
+            # needs none of them for the payloads this app sends
+            return orjson.dumps(obj).decode()
+
+    requests.models.complexjson = _OrjsonShim
 from config import (
     get_venue_id_candidates,
     API_RETRY_MAX,
     API_RETRY_DELAY_BASE,
     CACHE_TTL_HOURS,
+    SCORE_FIELD_NAMES,
+    CONFIDENCE_FIELD_NAMES,
 )
 from parsing import compute_score_stats, parse_score
 
@@ -22,68 +60,138 @@ class OpenReviewClientError(Exception):
     pass
 
 
-# Global client cache
-_client_cache = {}
-
+@st.cache_resource(show_spinner=False)
+def get_client() -> openreview.api.OpenReviewClient:
+    """
+    Create the shared OpenReview API client (one per Streamlit server).
+    A pooled requests.Session is attached so the many paginated calls of
+    get_all_notes reuse TCP+TLS connections instead of re-handshaking.
+    """
+    session = requests.Session()
+    session.mount(
+        "https://",
+        requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16),
+    )
 
-def create_client() -> openreview.api.OpenReviewClient:
-    """Create cached OpenReview API client."""
-    if 'client' in _client_cache:
-        return _client_cache['client']
-    
     try:
         client = openreview.api.OpenReviewClient(
             baseurl="https://api2.openreview.net"
         )
-        _client_cache['client'] = client
-        return client
     except Exception:
         client = openreview.Client(
             baseurl="https://api.openreview.net"
         )
-        _client_cache['client'] = client
-        return client
+
+    client.session = session
+    return client
+
+
+def _is_retryable(error: Exception) -> bool:
+    """
+    Only retry transient failures: network errors, 429 and 5xx.
+    Other 4xx responses (bad invitation, auth) won't succeed on retry.
+    """
+    if not isinstance(error, openreview.OpenReviewException):
+        return True
+
+    payload = error.args[0] if error.args else None
+    status = payload.get('status') if isinstance(payload, dict) else None
+    if not isinstance(status, int):
+        return True
+    return status == 429 or status >= 500
 
 
 def retry_with_backoff(
-    func: Callable, 
+    func: Callable,
     max_retries: int = API_RETRY_MAX,
     base_delay: float = API_RETRY_DELAY_BASE
 ) -> Any:
-    """Execute a function with exponential backoff retry."""
+    """Execute a function with jittered exponential backoff retry."""
     last_error = None
-    
+
     for attempt in range(max_retries):
         try:
             return func()
         except Exception as e:
             last_error = e
+            if not _is_retryable(e):
+                break
             if attempt < max_retries - 1:
-                delay = base_delay * (2 ** attempt)
+                # Random jitter keeps parallel venue fetches from
+                # synchronizing their retries against the API
+                delay = base_delay * (2 ** attempt) + random.uniform(0, base_delay)
                 time.sleep(delay)
-    
+
     raise OpenReviewClientError(f"API failed after {max_retries} attempts: {last_error}")
 
 
-# Keys that indicate a reply is a review
-# Keys that indicate a reply is a review
-REVIEW_INDICATOR_KEYS = {
+# Keys that indicate a reply is a review (frozenset: pre-hashed membership)
+REVIEW_INDICATOR_KEYS = frozenset({
     'rating', 'recommendation', 'soundness', 'contribution', 'summary', 'weaknesses',
     'strengths_and_weaknesses', 'quality', 'clarity', 'significance', 'originality',
     'confidence', 'questions', 'limitations', 'Overall Recommendation',
     'overall_recommendation', # Added for ICML snake_case
-}
+})
 
 
 def is_review_reply(reply: Dict[str, Any]) -> bool:
-    """Check if a reply looks like a review."""
+    """Check if a reply looks like a review (has at least one review field)."""
     content = reply.get('content', {})
     if not content:
         return False
-        
-    content_keys = set(content.keys())
-    matches = len(content_keys & REVIEW_INDICATOR_KEYS)
-    return matches >= 1  # Relaxed from 3 to 1 to ensure we catch reviews with few fields
+
+    # Short-circuit on the first indicator key instead of building a set
+    # and intersecting; review replies usually hit within 1-2 probes
+    return any(key in REVIEW_INDICATOR_KEYS for key in content)
+
+
+# Reply content fields worth keeping after score extraction (the review
+# detail renderer only shows score/confidence style fields)
+_REVIEW_DISPLAY_FIELDS = frozenset(SCORE_FIELD_NAMES) | frozenset(CONFIDENCE_FIELD_NAMES)
+
+
+def _compact_replies(replies: List[Dict]) -> List[Dict[str, Any]]:
+    """
+    Strip each reply down to the display-relevant content fields.
+    Raw replies carry signatures, histories and long review text that the
+    app never reads; dropping them keeps the st.cache_data entries (and
+    session memory) a fraction of the raw payload size.
+    """
+    compact = []
+    for reply in replies:
+        content = reply.get('content', {})
+        kept = {k: v for k, v in content.items() if k in _REVIEW_DISPLAY_FIELDS}
+        if kept:
+            compact.append({'content': kept})
+    return compact
+
+
+def _reduce_scores(arr) -> Tuple[float, float, float]:
+    """
+    Single-pass max/min/mean reduction over a non-empty float64 array.
+    Only used JIT-compiled: interpreted, this loop is slower than the
+    C-level builtins in the fallback below.
+    """
+    mx = arr[0]
+    mn = arr[0]
+    total = 0.0
+    for v in arr:
+        if v > mx:
+            mx = v
+        if v < mn:
+            mn = v
+        total += v
+    return mx, mn, total / arr.shape[0]
+
+
+if njit is not None:
+    _reduce_scores = njit(cache=True)(_reduce_scores)
+
+    def _score_stats(values: List[float]) -> Tuple[float, float, float]:
+        return _reduce_scores(np.asarray(values, dtype=np.float64))
+else:
+    def _score_stats(values: List[float]) -> Tuple[float, float, float]:
+        return max(values), min(values), sum(values) / len(values)
 
 
 def extract_scores_from_replies(replies: List[Dict]) -> Dict[str, Any]:
@@ -123,22 +231,201 @@ def extract_scores_from_replies(replies: List[Dict]) -> Dict[str, Any]:
             if conf_val is not None:
                 confidences.append(conf_val)
     
+    max_score = min_score = avg_score = avg_confidence = None
+    if scores:
+        max_score, min_score, avg_score = _score_stats(scores)
+    if confidences:
+        _, _, avg_confidence = _score_stats(confidences)
+
     return {
         "review_count": review_count,
         "scored_review_count": len(scores),
         "scores": scores,
         "confidences": confidences,
-        "max_score": max(scores) if scores else None,
-        "min_score": min(scores) if scores else None,
-        "avg_score": sum(scores) / len(scores) if scores else None,
-        "avg_confidence": sum(confidences) / len(confidences) if confidences else None,
+        "max_score": max_score,
+        "min_score": min_score,
+        "avg_score": avg_score,
+        "avg_confidence": avg_confidence,
     }
 
 
-@st.cache_data(ttl=CACHE_TTL_HOURS * 3600, show_spinner=False)
+def _unwrap_v2(content: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Flatten OpenReview v2 {'value': ...} wrappers in a single pass so the
+    per-note construction does plain dict lookups instead of calling a
+    closure with an isinstance check per field.
+    """
+    return {
+        k: (v["value"] if isinstance(v, dict) and "value" in v else v)
+        for k, v in content.items()
+    }
+
+
+def process_note(note, venue_id: str) -> Dict[str, Any]:
+    """Build one compact paper dict from a raw note (V1 or V2)."""
+    content = _unwrap_v2(note.content) if getattr(note, 'content', None) else {}
+
+    # Extract replies (reviews)
+    replies = []
+    if hasattr(note, 'details') and note.details:
+        replies = note.details.get('replies', [])
+
+    # Calculate scores from replies
+    score_stats = extract_scores_from_replies(replies)
+
+    paper = {
+        "id": note.id,
+        "forum": note.forum if hasattr(note, 'forum') else note.id,
+        "title": content.get("title") or "Untitled",
+        "abstract": content.get("abstract") or "",
+        "authors": content.get("authors") or [],
+        "keywords": content.get("keywords") or [],
+        "tldr": content.get("TL;DR") or content.get("tldr") or "",
+        "pdf": content.get("pdf") or "",
+        "venue_id": venue_id,
+        "reviews": _compact_replies(replies),
+        **score_stats,
+    }
+
+    # Precompute lowercased search text once at ingest so the
+    # keyword-filter path never re-lowercases per rerun
+    paper["_title_lc"] = paper["title"].lower()
+    paper["_abstract_lc"] = paper["abstract"].lower()
+    paper["_keywords_lc"] = " ".join(str(k).lower() for k in paper["keywords"])
+
+    # Build URLs
+    base_url = "https://openreview.net"
+    paper["openreview_url"] = f"{base_url}/forum?id={paper['forum']}"
+    if paper["pdf"] and not paper["pdf"].startswith("http"):
+        paper["pdf_url"] = f"{base_url}{paper['pdf']}"
+    else:
+        paper["pdf_url"] = paper["pdf"]
+
+    return paper
+
+
+def _stream_notes_to_papers(notes_iter, venue_id: str) -> List[Dict[str, Any]]:
+    """
+    Consume a note iterator incrementally, keeping only the compact paper
+    dicts. Raw notes (with full reply payloads) become garbage as soon as
+    each page is processed, instead of all living alongside the papers.
+    """
+    return [process_note(note, venue_id) for note in notes_iter]
+
+
+@st.cache_data(ttl=30 * 24 * 3600, show_spinner=False)
+def _probe_invitation_pattern(venue_id: str) -> str:
+    """
+    Probe each submission-invitation pattern with a limit-1 request and
+    remember which one the venue actually uses. Venues don't change their
+    invitation layout, so the winner is cached for 30 days — later loads
+    skip the full paginated round-trips against the losing patterns.
+
+    Raises LookupError when no pattern matches, so st.cache_data never
+    stores a negative result: a transient network failure during probing
+    must not disable the V2 path for a venue until the TTL expires.
+    """
+    client = get_client()
+    patterns = [
+        f"{venue_id}/-/Submission",
+        f"{venue_id}/-/Blind_Submission",
+        f"{venue_id}/-/Paper",
+    ]
+    for pattern in patterns:
+        try:
+            notes = client.get_notes(invitation=pattern, limit=1)
+            if notes:
+                return pattern
+        except Exception:
+            continue
+    raise LookupError(f"No submission invitation pattern matched for {venue_id}")
+
+
+def best_invitation_pattern(venue_id: str) -> Optional[str]:
+    """Cached probe wrapper: None (uncached) when no pattern matched."""
+    try:
+        return _probe_invitation_pattern(venue_id)
+    except LookupError:
+        return None
+
+
+# On-disk paper cache: survives Streamlit restarts, unlike st.cache_data
+DISK_CACHE_DIR = Path.home() / ".paperscout_cache"
+
+# Columns where parquet NaN must map back to the app's None convention
+_NULLABLE_SCORE_KEYS = ("avg_score", "max_score", "min_score", "avg_confidence")
+
+# Columns that parquet returns as ndarrays but the app truth-tests and
+# iterates as plain lists
+_LIST_KEYS = ("authors", "keywords", "reviews", "scores", "confidences")
+
+
+def _disk_cache_path(venue_id: str) -> Path:
+    return DISK_CACHE_DIR / f"{hashlib.sha1(venue_id.encode()).hexdigest()}.parquet"
+
+
+def _read_disk_cache(venue_id: str) -> Optional[List[Dict[str, Any]]]:
+    """Return cached papers for a venue, or None on miss/expiry/error."""
+    try:
+        path = _disk_cache_path(venue_id)
+        if not path.exists() or (time.time() - path.stat().st_mtime) > CACHE_TTL_HOURS * 3600:
+            return None
+        papers = pd.read_parquet(path).to_dict("records")
+    except Exception:
+        return None  # best-effort: fall through to the network fetch
+
+    for paper in papers:
+        for key in _NULLABLE_SCORE_KEYS:
+            val = paper.get(key)
+            if isinstance(val, float) and np.isnan(val):
+                paper[key] = None
+        for key in _LIST_KEYS:
+            val = paper.get(key)
+            if isinstance(val, np.ndarray):
+                paper[key] = val.tolist()
+            elif isinstance(val, float) and np.isnan(val):
+                paper[key] = []
+        # Parquet unions review content into one struct, padding fields a
+        # review lacks with None; drop those so the expander doesn't
+        # render literal "confidence: None" lines
+        for review in paper.get("reviews") or []:
+            content = review.get("content")
+            if content:
+                review["content"] = {
+                    k: v for k, v in content.items() if v is not None
+                }
+    return papers
+
+
+def _write_disk_cache(venue_id: str, papers: List[Dict[str, Any]]) -> None:
+    """Persist fetched papers as parquet; failures are non-fatal."""
+    try:
+        DISK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Arrow requires one type per review field across all rows, so a
+        # venue mixing e.g. int and "7: accept" ratings raises
+        # ArrowInvalid here and the venue simply goes uncached (every
+        # load refetches) — best-effort by design, not a working cache
+        pd.DataFrame(papers).to_parquet(_disk_cache_path(venue_id), compression="zstd")
+    except Exception:
+        pass
+
+
 def fetch_submissions_with_reviews(venue_id: str) -> Tuple[List[Dict[str, Any]], str]:
     """
     Fetch submissions WITH reviews using details=replies.
+
+    Thin wrapper that canonicalizes the venue ID (strip, collapse internal
+    whitespace) before hitting the cached implementation, so variants of a
+    custom-venue input don't each trigger a fresh expensive fetch. Case is
+    preserved because OpenReview IDs are case-sensitive.
+    """
+    return _fetch_submissions_with_reviews_impl(" ".join(venue_id.split()))
+
+
+@st.cache_data(ttl=CACHE_TTL_HOURS * 3600, show_spinner=False)
+def _fetch_submissions_with_reviews_impl(venue_id: str) -> Tuple[List[Dict[str, Any]], str]:
+    """
+    Fetch submissions WITH reviews using details=replies.
     For web-sourced venues (e.g. AAAI 2025), delegates to scrape_venue.
     """
     # Web Source Delegation
@@ -151,36 +438,29 @@ def fetch_submissions_with_reviews(venue_id: str) -> Tuple[List[Dict[str, Any]],
                 import web_scraper
                 return web_scraper.scrape_venue(venue_id), ""
 
-    client = create_client()
+    # Disk cache: lets a freshly restarted server skip the API entirely
+    cached = _read_disk_cache(venue_id)
+    if cached is not None:
+        reviewed_count = sum(p["scored_review_count"] > 0 for p in cached)
+        return cached, f"Loaded {len(cached)} papers from disk cache ({reviewed_count} with reviews)"
+
+    client = get_client()
     papers = []
-    
+
     try:
-        # Fetch with details=replies to get reviews
-        notes = retry_with_backoff(
-            lambda: list(client.get_all_notes(
-                invitation=f"{venue_id}/-/Submission",
-                details="replies"
-            ))
-        )
-        
-        if not notes:
-            # Try alternative patterns
-            for pattern in [f"{venue_id}/-/Blind_Submission", f"{venue_id}/-/Paper"]:
-                try:
-                    notes = retry_with_backoff(
-                        lambda p=pattern: list(client.get_all_notes(
-                            invitation=p,
-                            details="replies"
-                        ))
-                    )
-                    if notes:
-                        break
-                except Exception:
-                    continue
-        
-        
+        # Cheap limit-1 probe (cached 30 days) picks the right invitation
+        # pattern, then one paginated fetch streams notes into paper dicts
+        pattern = best_invitation_pattern(venue_id)
+        if pattern:
+            papers = retry_with_backoff(
+                lambda: _stream_notes_to_papers(
+                    client.get_all_notes(invitation=pattern, details="replies"),
+                    venue_id,
+                )
+            )
+
         # --- V1 API Fallback for legacy conferences (e.g. ICLR 2023) ---
-        if not notes:
+        if not papers:
             print(f"No notes found on V2 for {venue_id}. Trying V1 API...")
             try:
                 # Initialize V1 client fallback
@@ -196,21 +476,24 @@ def fetch_submissions_with_reviews(venue_id: str) -> Tuple[List[Dict[str, Any]],
                     f"{venue_id}/-/Blind_Submission",
                     f"{venue_id}/-/Paper"
                 ]
-                
+
                 for p in v1_patterns:
                     try:
                         # Use tools to iterate all notes if available
                         if hasattr(openreview, 'tools') and hasattr(openreview.tools, 'iterget_notes'):
                             print(f"Using iterget_notes for {p}")
                             iterator = openreview.tools.iterget_notes(v1_client, invitation=p, details='replies')
-                            notes = list(iterator)
+                            papers = _stream_notes_to_papers(iterator, venue_id)
                         else:
                             # Simple fetch
                             print(f"Using get_notes for {p}")
-                            notes = v1_client.get_notes(invitation=p, limit=3000, details='replies')
-                            
-                        if notes:
-                            print(f"Found {len(notes)} notes on V1 with {p}")
+                            papers = _stream_notes_to_papers(
+                                v1_client.get_notes(invitation=p, limit=3000, details='replies'),
+                                venue_id,
+                            )
+
+                        if papers:
+                            print(f"Found {len(papers)} notes on V1 with {p}")
                             break
                     except Exception as e:
                         # print(f"V1 attempt failed for {p}: {e}")
@@ -218,49 +501,12 @@ def fetch_submissions_with_reviews(venue_id: str) -> Tuple[List[Dict[str, Any]],
             except Exception as e:
                 print(f"V1 Fallback failed: {e}")
 
-        for note in notes:
-            content = note.content if hasattr(note, 'content') else {}
-            
-            def get_val(key):
-                val = content.get(key)
-                if isinstance(val, dict) and 'value' in val:
-                    return val['value']
-                return val
-            
-            # Extract replies (reviews)
-            replies = []
-            if hasattr(note, 'details') and note.details:
-                replies = note.details.get('replies', [])
-            
-            # Calculate scores from replies
-            score_stats = extract_scores_from_replies(replies)
-            
-            paper = {
-                "id": note.id,
-                "forum": note.forum if hasattr(note, 'forum') else note.id,
-                "title": get_val("title") or "Untitled",
-                "abstract": get_val("abstract") or "",
-                "authors": get_val("authors") or [],
-                "keywords": get_val("keywords") or [],
-                "tldr": get_val("TL;DR") or get_val("tldr") or "",
-                "pdf": get_val("pdf") or "",
-                "venue_id": venue_id,
-                **score_stats,
-            }
-            
-            # Build URLs
-            base_url = "https://openreview.net"
-            paper["openreview_url"] = f"{base_url}/forum?id={paper['forum']}"
-            if paper["pdf"] and not paper["pdf"].startswith("http"):
-                paper["pdf_url"] = f"{base_url}{paper['pdf']}"
-            else:
-                paper["pdf_url"] = paper["pdf"]
-            
-            papers.append(paper)
-        
-        reviewed_count = sum(1 for p in papers if p.get("scored_review_count", 0) > 0)
+        if papers:
+            _write_disk_cache(venue_id, papers)
+
+        reviewed_count = sum(p["scored_review_count"] > 0 for p in papers)
         return papers, f"Fetched {len(papers)} papers ({reviewed_count} with reviews)"
-        
+
     except Exception as e:
         return [], f"Error: {str(e)}"
 
@@ -269,7 +515,7 @@ def fetch_submissions_with_reviews(venue_id: str) -> Tuple[List[Dict[str, Any]],
 @st.cache_data(ttl=CACHE_TTL_HOURS * 3600, show_spinner=False)
 def fetch_submissions_cached(venue_id: str) -> Tuple[List[Dict[str, Any]], str]:
     """Fetch submissions only (fast, no reviews)."""
-    client = create_client()
+    client = get_client()
     submissions = []
     
     try:
@@ -292,33 +538,31 @@ def fetch_submissions_cached(venue_id: str) -> Tuple[List[Dict[str, Any]], str]:
                     continue
         
         for note in notes:
-            content = note.content if hasattr(note, 'content') else {}
-            
-            def get_val(key):
-                val = content.get(key)
-                if isinstance(val, dict) and 'value' in val:
-                    return val['value']
-                return val
-            
+            content = _unwrap_v2(note.content) if getattr(note, 'content', None) else {}
+
             submission = {
                 "id": note.id,
                 "forum": note.forum if hasattr(note, 'forum') else note.id,
-                "title": get_val("title") or "Untitled",
-                "abstract": get_val("abstract") or "",
-                "authors": get_val("authors") or [],
-                "keywords": get_val("keywords") or [],
-                "tldr": get_val("TL;DR") or get_val("tldr") or "",
-                "pdf": get_val("pdf") or "",
+                "title": content.get("title") or "Untitled",
+                "abstract": content.get("abstract") or "",
+                "authors": content.get("authors") or [],
+                "keywords": content.get("keywords") or [],
+                "tldr": content.get("TL;DR") or content.get("tldr") or "",
+                "pdf": content.get("pdf") or "",
                 "venue_id": venue_id,
             }
             
+            submission["_title_lc"] = submission["title"].lower()
+            submission["_abstract_lc"] = submission["abstract"].lower()
+            submission["_keywords_lc"] = " ".join(str(k).lower() for k in submission["keywords"])
+
             base_url = "https://openreview.net"
             submission["openreview_url"] = f"{base_url}/forum?id={submission['forum']}"
             if submission["pdf"] and not submission["pdf"].startswith("http"):
                 submission["pdf_url"] = f"{base_url}{submission['pdf']}"
             else:
                 submission["pdf_url"] = submission["pdf"]
-            
+
             submissions.append(submission)
         
         return submissions, f"Fetched {len(submissions)} submissions"
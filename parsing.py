@@ -3,90 +3,174 @@ Parsing utilities for OpenReview Paper Filtering Tool.
 Handles score parsing, keyword matching, and statistics computation.
 """
 
+import math
 import re
-from typing import List, Dict, Optional, Any, Tuple
+from functools import lru_cache
+from operator import itemgetter
+
+import numpy as np
+from typing import List, Dict, Iterable, Optional, Any, Tuple
 from config import SCORE_FIELD_NAMES, CONFIDENCE_FIELD_NAMES
 
+# Optional: Aho-Corasick automaton for single-pass multi-keyword matching
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional: numba JIT for the fused score-filter loop
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Optional: hyperscan SIMD multi-pattern matcher for very large corpora
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+
+_DIGITS = "0123456789"
+
+
+def _scan_first_number(text: str) -> Optional[float]:
+    """
+    Locate the first (optionally signed) int or float in a string with a
+    plain character scan — no regex engine setup on this per-review path.
+    """
+    n = len(text)
+    start = 0
+    while start < n:
+        ch = text[start]
+        if ch in _DIGITS:
+            break
+        if ch in "-+" and start + 1 < n and text[start + 1] in _DIGITS:
+            break
+        start += 1
+    else:
+        return None
+
+    end = start + 1
+    seen_dot = False
+    while end < n:
+        ch = text[end]
+        if ch in _DIGITS:
+            end += 1
+        elif ch == "." and not seen_dot:
+            seen_dot = True
+            end += 1
+        else:
+            break
+
+    try:
+        return float(text[start:end])
+    except ValueError:
+        return None
+
 
 def parse_score(text: Any) -> Optional[float]:
     """
     Extract numeric score from a review field value.
-    
+
     Handles various formats:
     - "6: Strong Accept" -> 6.0
     - "8 (Top 10%)" -> 8.0
     - "3.5" -> 3.5
     - 7 -> 7.0
     - "Accept" -> None
-    
+
     Args:
         text: The field value (string, int, float, or other)
-        
+
     Returns:
         Extracted float score or None if not parseable
     """
     if text is None:
         return None
-    
+
     # If already numeric
     if isinstance(text, (int, float)):
         return float(text)
-    
+
     # Convert to string
     text_str = str(text).strip()
     if not text_str:
         return None
-    
-    # Try to find the first number (int or float) in the string
-    # Pattern matches: optional negative, digits, optional decimal part
-    match = re.search(r'-?\d+\.?\d*', text_str)
-    if match:
-        try:
-            return float(match.group())
-        except ValueError:
-            return None
-    
-    return None
+
+    # Fast path: the whole string is already a plain number ("6", "3.5").
+    # float() also accepts "nan"/"inf" (which would poison avg_score) and
+    # exotic literals like "1e5"/"1_0" that the scanner reads differently,
+    # so those fall through to the scan instead.
+    try:
+        value = float(text_str)
+    except ValueError:
+        pass
+    else:
+        if math.isfinite(value) and not any(ch in "eE_" for ch in text_str):
+            return value
+
+    # Fall back to a single character scan for annotated strings like
+    # "6: Strong Accept" or "8 (Top 10%)"
+    return _scan_first_number(text_str)
+
+
+# Field-name priority maps frozen at import: probing walks the content
+# dict once and ranks hits, instead of hashing every candidate field
+# name against the dict (most of which miss)
+_SCORE_PRIORITY = {name: i for i, name in enumerate(SCORE_FIELD_NAMES)}
+_CONFIDENCE_PRIORITY = {name: i for i, name in enumerate(CONFIDENCE_FIELD_NAMES)}
+
+
+def _parse_field_value(value: Any) -> Optional[float]:
+    """
+    Parse one content field, with the numeric fast path inlined so the
+    common case (API already returns an int/float) skips parse_score.
+    """
+    # Handle nested dict format (OpenReview v2 API)
+    if isinstance(value, dict) and "value" in value:
+        value = value["value"]
+    if isinstance(value, float):
+        return value
+    if isinstance(value, int):
+        return float(value)
+    return parse_score(value)
+
+
+def _best_parsed(content: Dict[str, Any], priority: Dict[str, int]) -> Optional[float]:
+    """
+    Walk the content dict once collecting known fields, then parse them
+    in priority order, keeping the first value that actually parses.
+    """
+    hits = [(priority[key], value) for key, value in content.items() if key in priority]
+    if not hits:
+        return None
+    hits.sort(key=itemgetter(0))
+    return next(
+        (
+            parsed
+            for parsed in (_parse_field_value(value) for _, value in hits)
+            if parsed is not None
+        ),
+        None,
+    )
 
 
 def extract_review_scores(review: Dict[str, Any]) -> Tuple[Optional[float], Optional[float]]:
     """
     Extract score and confidence from a review dict.
-    
+
     Args:
         review: Review dictionary containing content fields
-        
+
     Returns:
         Tuple of (score, confidence), either may be None
     """
     content = review.get("content", {})
-    
-    # Extract score (try multiple field names in priority order)
-    score = None
-    for field_name in SCORE_FIELD_NAMES:
-        if field_name in content:
-            value = content[field_name]
-            # Handle nested dict format (OpenReview v2 API)
-            if isinstance(value, dict) and "value" in value:
-                value = value["value"]
-            parsed = parse_score(value)
-            if parsed is not None:
-                score = parsed
-                break
-    
-    # Extract confidence
-    confidence = None
-    for field_name in CONFIDENCE_FIELD_NAMES:
-        if field_name in content:
-            value = content[field_name]
-            if isinstance(value, dict) and "value" in value:
-                value = value["value"]
-            parsed = parse_score(value)
-            if parsed is not None:
-                confidence = parsed
-                break
-    
-    return score, confidence
+    return (
+        _best_parsed(content, _SCORE_PRIORITY),
+        _best_parsed(content, _CONFIDENCE_PRIORITY),
+    )
 
 
 def compute_score_stats(reviews: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -124,8 +208,189 @@ def compute_score_stats(reviews: List[Dict[str, Any]]) -> Dict[str, Any]:
     return result
 
 
+@lru_cache(maxsize=32)
+def _build_keyword_automaton(keywords_lower: Tuple[str, ...]):
+    """
+    Build (and cache) an Aho-Corasick automaton for a keyword tuple.
+    The automaton finds all keywords in a single linear pass over the text
+    instead of one substring scan per keyword.
+    """
+    automaton = ahocorasick.Automaton()
+    for idx, kw in enumerate(keywords_lower):
+        automaton.add_word(kw, idx)
+    automaton.make_automaton()
+    return automaton
+
+
+def match_texts_automaton(
+    texts: Iterable[str],
+    keywords_lower: List[str],
+    logic: str = "OR"
+) -> Optional[List[bool]]:
+    """
+    Match many lowercase texts against keywords in one automaton pass each.
+
+    Args:
+        texts: Iterable of lowercase text strings
+        keywords_lower: List of lowercase keywords
+        logic: "AND" or "OR"
+
+    Returns:
+        List of booleans (one per text), or None if pyahocorasick is not
+        installed (caller should fall back to per-keyword substring scans)
+    """
+    if ahocorasick is None:
+        return None
+
+    # Dedupe (order-preserving): add_word overwrites the index for a
+    # repeated keyword, which would make the AND count unreachable
+    keywords_unique = tuple(dict.fromkeys(keywords_lower))
+    automaton = _build_keyword_automaton(keywords_unique)
+    need_all = logic.upper() == "AND"
+    n_keywords = len(keywords_unique)
+
+    results = []
+    for text in texts:
+        matched = set()
+        for _, idx in automaton.iter(text):
+            matched.add(idx)
+            # Early exit: OR needs one hit, AND needs all keywords seen
+            if not need_all or len(matched) == n_keywords:
+                break
+        results.append(len(matched) == n_keywords if need_all else bool(matched))
+
+    return results
+
+
+# Hyperscan setup cost only pays off on big corpora with many keywords;
+# below these the automaton/substring paths win
+HYPERSCAN_MIN_TEXTS = 10_000
+HYPERSCAN_MIN_KEYWORDS = 5
+
+
+@lru_cache(maxsize=32)
+def _build_hyperscan_db(keywords_lower: Tuple[str, ...]):
+    """Compile (and cache) one hyperscan database for a keyword tuple."""
+    db = hyperscan.Database()
+    n = len(keywords_lower)
+    db.compile(
+        expressions=[re.escape(kw).encode("utf-8") for kw in keywords_lower],
+        ids=list(range(n)),
+        flags=[hyperscan.HS_FLAG_CASELESS] * n,
+    )
+    return db
+
+
+def match_texts_hyperscan(
+    texts: Iterable[str],
+    keywords_lower: List[str],
+    logic: str = "OR"
+) -> Optional[List[bool]]:
+    """
+    Match many texts against keywords with hyperscan's vectorized DFA.
+
+    Same contract as match_texts_automaton: a list of booleans, or None
+    when hyperscan is unavailable or compilation fails (caller falls back
+    to the automaton/substring paths).
+    """
+    if hyperscan is None:
+        return None
+    try:
+        db = _build_hyperscan_db(tuple(keywords_lower))
+    except Exception:
+        return None
+
+    need_all = logic.upper() == "AND"
+    n_keywords = len(keywords_lower)
+
+    results = []
+    matched = set()
+
+    scan_terminated = getattr(hyperscan, "ScanTerminated", ())
+
+    def on_match(pat_id, start, end, flags, context):
+        matched.add(pat_id)
+        # Truthy return halts the scan: OR needs one hit, AND all keywords
+        return not need_all or len(matched) == n_keywords
+
+    for text in texts:
+        matched.clear()
+        try:
+            db.scan(text.encode("utf-8", "replace"), match_event_handler=on_match)
+        except scan_terminated:
+            pass  # handler requested the halt after a decisive match
+        results.append(len(matched) == n_keywords if need_all else bool(matched))
+
+    return results
+
+
+def _grouped_reductions(
+    papers: List[Dict[str, Any]],
+    key: str
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per-paper max/min/mean over the value lists stored under `key`,
+    computed with grouped reduceat calls on one flat array.
+    Papers with no values get NaN.
+    """
+    # Explicit None checks: cached papers may hold ndarrays, whose
+    # truthiness is ambiguous
+    groups = [p.get(key) for p in papers]
+    n = len(papers)
+    counts = np.fromiter(
+        (0 if g is None else len(g) for g in groups), dtype=np.int64, count=n
+    )
+    maxs = np.full(n, np.nan)
+    mins = np.full(n, np.nan)
+    means = np.full(n, np.nan)
+
+    nonzero = counts > 0
+    if nonzero.any():
+        flat = np.fromiter(
+            (v for g in groups if g is not None for v in g),
+            dtype=np.float64,
+        )
+        # Group starts over non-empty papers only, so reduceat never sees
+        # zero-length segments
+        nz_counts = counts[nonzero]
+        nz_starts = np.zeros(nz_counts.size, dtype=np.int64)
+        nz_starts[1:] = np.cumsum(nz_counts)[:-1]
+
+        maxs[nonzero] = np.maximum.reduceat(flat, nz_starts)
+        mins[nonzero] = np.minimum.reduceat(flat, nz_starts)
+        means[nonzero] = np.add.reduceat(flat, nz_starts) / nz_counts
+
+    return maxs, mins, means, counts
+
+
+def compute_all_paper_stats(papers: List[Dict[str, Any]]) -> None:
+    """
+    Recompute score statistics for many papers in one vectorized pass.
+
+    Batch companion to compute_score_stats: instead of per-paper Python
+    max/min/sum calls, the per-review score lists attached at ingest are
+    flattened into one array and reduced with np.maximum/add.reduceat.
+    Results are written back onto the paper dicts in place (NaN -> None).
+    """
+    if not papers:
+        return
+
+    maxs, mins, means, counts = _grouped_reductions(papers, "scores")
+    _, _, conf_means, _ = _grouped_reductions(papers, "confidences")
+
+    for i, paper in enumerate(papers):
+        has_scores = counts[i] > 0
+        paper["scored_review_count"] = int(counts[i])
+        paper["max_score"] = float(maxs[i]) if has_scores else None
+        paper["min_score"] = float(mins[i]) if has_scores else None
+        paper["avg_score"] = float(means[i]) if has_scores else None
+        paper["avg_confidence"] = (
+            float(conf_means[i]) if not np.isnan(conf_means[i]) else None
+        )
+
+
 def match_keywords(
-    text: str, 
+    text: str,
     keywords: List[str], 
     logic: str = "OR"
 ) -> bool:
@@ -142,13 +407,33 @@ def match_keywords(
     """
     if not keywords or not text:
         return True  # No keywords means everything matches
-    
-    text_lower = text.lower()
-    
+
+    return _match_keywords_prelower(
+        text.lower(), [kw.lower() for kw in keywords], logic
+    )
+
+
+def _match_keywords_prelower(
+    text_lower: str,
+    keywords_lower: List[str],
+    logic: str = "OR"
+) -> bool:
+    """
+    match_keywords core for already-lowercased inputs. The inner loop is
+    pure C-level substring scans with no per-paper string allocation.
+    """
+    if not keywords_lower or not text_lower:
+        return True
+
+    # 3+ keywords: one automaton pass beats repeated substring scans.
+    # For 1-2 keywords the C-level `in` scan wins, so keep it.
+    if ahocorasick is not None and len(keywords_lower) > 2:
+        return match_texts_automaton([text_lower], keywords_lower, logic)[0]
+
     if logic.upper() == "AND":
-        return all(kw.lower() in text_lower for kw in keywords)
+        return all(kw in text_lower for kw in keywords_lower)
     else:  # OR
-        return any(kw.lower() in text_lower for kw in keywords)
+        return any(kw in text_lower for kw in keywords_lower)
 
 
 def filter_paper_by_keywords(
@@ -171,20 +456,61 @@ def filter_paper_by_keywords(
     """
     if not keywords:
         return True
-    
-    title = paper.get("title", "") or ""
-    abstract = paper.get("abstract", "") or ""
-    
+
+    # Prefer the lowercased text precomputed at ingest; papers built
+    # outside the loading pipeline get it lazily and keep it cached, so
+    # even they only pay for .lower() on the first filter pass
+    title = paper.get("_title_lc")
+    if title is None:
+        title = (paper.get("title", "") or "").lower()
+        paper["_title_lc"] = title
+    abstract = paper.get("_abstract_lc")
+    if abstract is None:
+        abstract = (paper.get("abstract", "") or "").lower()
+        paper["_abstract_lc"] = abstract
+    
+    # Lowercase the keywords once per paper instead of once per field scan
+    keywords_lower = [kw.lower() for kw in keywords]
+
     if field_scope == "title":
-        return match_keywords(title, keywords, logic)
+        return _match_keywords_prelower(title, keywords_lower, logic)
     elif field_scope == "abstract":
-        return match_keywords(abstract, keywords, logic)
+        return _match_keywords_prelower(abstract, keywords_lower, logic)
     elif field_scope == "title_or_abstract":
-        return match_keywords(title, keywords, logic) or match_keywords(abstract, keywords, logic)
+        if logic.upper() == "OR":
+            # One scan over the concatenated text instead of two. When a
+            # field is empty the two-call version matches unconditionally
+            # (empty text matches everything), so keep that answer here.
+            if not title or not abstract:
+                return True
+            text = paper.get("_text_lc")
+            if text is None:
+                text = title + " " + abstract
+                paper["_text_lc"] = text
+            # ASCII keywords against non-ASCII-heavy text: search the
+            # cached UTF-8 bytes so the scan runs over one byte per char
+            # instead of the widened codepoint buffer. For 3+ keywords
+            # the automaton pass below wins instead.
+            if len(keywords_lower) <= 2 and all(kw.isascii() for kw in keywords_lower):
+                search_bytes = paper.get("_search_bytes")
+                if search_bytes is None:
+                    search_bytes = text.encode("utf-8", "replace")
+                    paper["_search_bytes"] = search_bytes
+                return any(kw.encode("ascii") in search_bytes for kw in keywords_lower)
+            return _match_keywords_prelower(text, keywords_lower, logic)
+        # AND logic: a single field must contain all keywords, so the
+        # concatenated scan (which would allow cross-field splits) is wrong
+        return (
+            _match_keywords_prelower(title, keywords_lower, logic)
+            or _match_keywords_prelower(abstract, keywords_lower, logic)
+        )
     elif field_scope == "title_and_abstract":
-        return match_keywords(title, keywords, logic) and match_keywords(abstract, keywords, logic)
+        return (
+            _match_keywords_prelower(title, keywords_lower, logic)
+            and _match_keywords_prelower(abstract, keywords_lower, logic)
+        )
     else:
-        return match_keywords(title + " " + abstract, keywords, logic)
+        return _match_keywords_prelower(title + " " + abstract, keywords_lower, logic)
 
 
 def filter_paper_by_scores(
@@ -207,67 +533,210 @@ def filter_paper_by_scores(
     Returns:
         True if paper meets all criteria
     """
-    avg_score = paper.get("avg_score")
-    max_score = paper.get("max_score")
-    scored_count = paper.get("scored_review_count", 0)
-    avg_confidence = paper.get("avg_confidence")
-    
+    # Only look up the fields whose thresholds are actually set; with the
+    # common single-threshold filters this skips most dict lookups per paper
+
     # Check average score
     if min_avg_score is not None:
+        avg_score = paper.get("avg_score")
         if avg_score is None or avg_score < min_avg_score:
             return False
-    
+
     # Check max score
     if min_max_score is not None:
+        max_score = paper.get("max_score")
         if max_score is None or max_score < min_max_score:
             return False
-    
+
     # Check review count
     if min_review_count is not None:
-        if scored_count < min_review_count:
+        if paper.get("scored_review_count", 0) < min_review_count:
             return False
-    
+
     # Check confidence
     if min_confidence is not None:
+        avg_confidence = paper.get("avg_confidence")
         if avg_confidence is None or avg_confidence < min_confidence:
             return False
-    
+
     return True
 
 
+# Below this row count the numpy mask path wins; the fused loop only pays
+# off once per-array traversal costs dominate
+_NUMBA_FILTER_THRESHOLD = 1000
+
+
+def _score_filter_mask_loop(avg, mx, cnt, conf, min_avg, min_max, min_cnt, min_conf):
+    """
+    Fused single-pass score filter: one traversal checks every active
+    threshold per paper. NaN thresholds mean "inactive"; NaN values fail
+    active thresholds (the `not >=` form makes NaN comparisons False).
+    """
+    n = avg.shape[0]
+    out = np.ones(n, dtype=np.bool_)
+    for i in range(n):
+        if not np.isnan(min_avg) and not (avg[i] >= min_avg):
+            out[i] = False
+        elif not np.isnan(min_max) and not (mx[i] >= min_max):
+            out[i] = False
+        elif cnt[i] < min_cnt:
+            out[i] = False
+        elif not np.isnan(min_conf) and not (conf[i] >= min_conf):
+            out[i] = False
+    return out
+
+
+if njit is not None:
+    _score_filter_mask_loop = njit(cache=True)(_score_filter_mask_loop)
+
+
+def score_filter_mask(
+    avg_scores: np.ndarray,
+    max_scores: np.ndarray,
+    review_counts: np.ndarray,
+    confidences: np.ndarray,
+    min_avg_score: Optional[float] = None,
+    min_max_score: Optional[float] = None,
+    min_review_count: Optional[int] = None,
+    min_confidence: Optional[float] = None,
+) -> np.ndarray:
+    """
+    Vectorized filter_paper_by_scores over parallel score arrays.
+
+    Returns a boolean mask of papers meeting all active thresholds.
+    Large datasets use one fused JIT-compiled pass when numba is
+    installed; otherwise (and for small datasets) per-threshold NumPy
+    masks are combined, which costs one array traversal per threshold.
+    """
+    n = avg_scores.shape[0]
+
+    if njit is not None and n > _NUMBA_FILTER_THRESHOLD:
+        return _score_filter_mask_loop(
+            np.asarray(avg_scores, dtype=np.float64),
+            np.asarray(max_scores, dtype=np.float64),
+            np.asarray(review_counts, dtype=np.int64),
+            np.asarray(confidences, dtype=np.float64),
+            np.nan if min_avg_score is None else float(min_avg_score),
+            np.nan if min_max_score is None else float(min_max_score),
+            0 if min_review_count is None else int(min_review_count),
+            np.nan if min_confidence is None else float(min_confidence),
+        )
+
+    mask = np.ones(n, dtype=bool)
+    if min_avg_score is not None:
+        mask &= avg_scores >= min_avg_score
+    if min_max_score is not None:
+        mask &= max_scores >= min_max_score
+    if min_review_count is not None:
+        mask &= review_counts >= min_review_count
+    if min_confidence is not None:
+        mask &= confidences >= min_confidence
+    return mask
+
+
+@lru_cache(maxsize=256)
+def _compile_highlight_pattern(keywords: Tuple[str, ...]) -> "re.Pattern":
+    """Compile (and cache) one alternation pattern for a keyword tuple."""
+    return re.compile(
+        "(" + "|".join(re.escape(kw) for kw in keywords) + ")",
+        re.IGNORECASE,
+    )
+
+
+_MARK_OPEN = '<mark style="background-color: #ffeb3b; padding: 0 2px;">'
+_MARK_CLOSE = "</mark>"
+
+
+def _highlight_automaton(text: str, keywords: Tuple[str, ...]) -> Optional[str]:
+    """
+    Single-pass highlighter: scan the lowercased text with a cached
+    Aho-Corasick automaton, merge overlapping hit spans, then stitch the
+    output from original-case slices. Returns None when the automaton
+    path cannot be used (pyahocorasick missing, or lowercasing changed
+    the string length so span offsets would not line up).
+    """
+    if ahocorasick is None:
+        return None
+
+    text_lower = text.lower()
+    if len(text_lower) != len(text):
+        return None
+
+    keywords_lower = tuple(kw.lower() for kw in keywords)
+    automaton = _build_keyword_automaton(keywords_lower)
+
+    spans = [
+        (end - len(keywords_lower[idx]) + 1, end + 1)
+        for end, idx in automaton.iter(text_lower)
+    ]
+    if not spans:
+        return text
+
+    # Merge overlapping spans so nested/adjacent hits become one <mark>
+    spans.sort()
+    merged = []
+    cur_start, cur_end = spans[0]
+    for start, end in spans[1:]:
+        if start <= cur_end:
+            cur_end = max(cur_end, end)
+        else:
+            merged.append((cur_start, cur_end))
+            cur_start, cur_end = start, end
+    merged.append((cur_start, cur_end))
+
+    parts = []
+    pos = 0
+    for start, end in merged:
+        parts.append(text[pos:start])
+        parts.append(_MARK_OPEN)
+        parts.append(text[start:end])
+        parts.append(_MARK_CLOSE)
+        pos = end
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
 def highlight_keywords(text: str, keywords: List[str]) -> str:
     """
     Highlight keywords in text using HTML markup.
-    
+    Prefers one linear Aho-Corasick scan with slice stitching; falls back
+    to a single cached alternation pattern, so each text is scanned once
+    regardless of keyword count and nothing is recompiled per render.
+
     Args:
         text: Original text
         keywords: Keywords to highlight
-        
+
     Returns:
         HTML string with highlighted keywords
     """
     if not keywords or not text:
         return text
-    
-    result = text
-    for kw in keywords:
-        if not kw:
-            continue
-        # Case-insensitive replacement with highlight
-        pattern = re.compile(re.escape(kw), re.IGNORECASE)
-        result = pattern.sub(
-            lambda m: f'<mark style="background-color: #ffeb3b; padding: 0 2px;">{m.group()}</mark>',
-            result
-        )
-    
-    return result
 
+    valid_keywords = tuple(kw for kw in keywords if kw)
+    if not valid_keywords:
+        return text
+
+    highlighted = _highlight_automaton(text, valid_keywords)
+    if highlighted is not None:
+        return highlighted
 
+    pattern = _compile_highlight_pattern(valid_keywords)
+    return pattern.sub(
+        lambda m: f"{_MARK_OPEN}{m.group(0)}{_MARK_CLOSE}",
+        text
+    )
+
+
+@lru_cache(maxsize=128)
 def parse_keywords_input(input_str: str) -> List[str]:
     """
     Parse user keyword input string into list of keywords.
     Supports comma and space separation.
-    
+    Memoized: Streamlit re-parses the same input on every rerun.
+    Callers must not mutate the returned list.
+
     Args:
         input_str: User input like "transformer, attention" or "transformer attention"
         
@@ -302,11 +771,22 @@ def sort_papers(
     Returns:
         Sorted list of papers
     """
+    # Fast paths: when no None values need special-casing, a C-level
+    # itemgetter key avoids one Python closure call per element
+    if papers:
+        if sort_by == "title":
+            if all("_title_lc" in p for p in papers):
+                return sorted(papers, key=itemgetter("_title_lc"), reverse=not ascending)
+        elif all(p.get(sort_by) is not None for p in papers):
+            return sorted(papers, key=itemgetter(sort_by), reverse=not ascending)
+
     def get_sort_key(paper):
         value = paper.get(sort_by)
         if value is None:
-            # Put None values at the end
-            return (1, 0) if not ascending else (0, float('inf'))
+            # Put None values at the end (with reverse=True the smallest
+            # key lands last), matching na_position="last" on the
+            # DataFrame path
+            return (-1, 0) if not ascending else (0, float('inf'))
         if isinstance(value, str):
             return (0, value.lower())
         return (0, value)
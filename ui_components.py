@@ -239,6 +239,29 @@ def render_filter_summary(filters: Dict[str, Any], result_count: int, total_coun
         st.metric("匹配结果", f"{result_count} / {total_count}")
 
 
+def _format_authors(authors) -> str:
+    """Show up to three authors, with a '+N more' suffix."""
+    if authors is None or len(authors) == 0:
+        return ""
+    authors = list(authors)
+    names = ", ".join(authors[:3])
+    if len(authors) > 3:
+        names += f" +{len(authors) - 3} more"
+    return names
+
+
+def _rerun_fragment() -> None:
+    """
+    Rerun only the enclosing fragment where Streamlit supports scoped
+    reruns (1.37+, same releases that have stable st.fragment); older
+    installs fall back to a full-script rerun.
+    """
+    if hasattr(st, "fragment"):
+        st.rerun(scope="fragment")
+    else:
+        st.rerun()
+
+
 def render_paper_table(
     papers: List[Dict[str, Any]], 
     page: int, 
@@ -266,32 +289,33 @@ def render_paper_table(
         with cols[0]:
             if st.button("◀ 上一页", disabled=page == 0):
                 st.session_state.current_page = page - 1
-                st.rerun()
+                _rerun_fragment()
         with cols[1]:
             st.markdown(f"<center>第 {page + 1} / {total_pages} 页 (共 {total_papers} 条)</center>", unsafe_allow_html=True)
         with cols[2]:
             if st.button("下一页 ▶", disabled=page >= total_pages - 1):
                 st.session_state.current_page = page + 1
-                st.rerun()
-    
-    # Create summary dataframe
-    df_data = []
-    for paper in page_papers:
-        authors_str = ", ".join(paper.get("authors", [])[:3])
-        if len(paper.get("authors", [])) > 3:
-            authors_str += f" +{len(paper['authors']) - 3} more"
-        
-        df_data.append({
-            "标题": paper.get("title", "Untitled"),
-            "会议/年份": f"{paper.get('venue', '')} {paper.get('year', '')}",
-            "作者": authors_str,
-            "平均分": f"{paper.get('avg_score', '-'):.1f}" if paper.get('avg_score') else "-",
-            "最高分": f"{paper.get('max_score', '-'):.1f}" if paper.get('max_score') else "-",
-            "评审数": paper.get("scored_review_count", 0),
-        })
+                _rerun_fragment()
     
-    df = pd.DataFrame(df_data)
-    st.dataframe(df, use_container_width=True, hide_index=True)
+    # Create summary dataframe column-wise instead of dict-per-row
+    raw = pd.DataFrame.from_records(
+        page_papers,
+        columns=["title", "venue", "year", "authors", "avg_score",
+                 "max_score", "scored_review_count"],
+    )
+    df = pd.DataFrame({
+        "标题": raw["title"].fillna("Untitled"),
+        "会议/年份": raw["venue"].fillna("").astype(str) + " " + raw["year"].fillna("").astype(str),
+        "作者": raw["authors"].map(_format_authors),
+        # Zero means "no score" upstream, so blank it like the NaNs
+        "平均分": raw["avg_score"].where(raw["avg_score"] != 0),
+        "最高分": raw["max_score"].where(raw["max_score"] != 0),
+        "评审数": raw["scored_review_count"].fillna(0).astype(int),
+    })
+    # Styler formats the numeric columns in one vectorized pass instead
+    # of a Python-level f-string call per cell
+    styled = df.style.format({"平均分": "{:.1f}", "最高分": "{:.1f}"}, na_rep="-")
+    st.dataframe(styled, use_container_width=True, hide_index=True)
     
     # Expandable details for each paper
     st.markdown("---")
@@ -1,11 +1,86 @@
 import requests
 import json
 import re
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Iterable, List, Dict, Any, Tuple
+
+# Optional: orjson parses the multi-megabyte yearly payloads several
+# times faster than the stdlib decoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(data: bytes) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
 
 # GitHub URL template for AAAI data (maintained by Paper Copilot community)
 AAAI_GITHUB_URL_TEMPLATE = "https://raw.githubusercontent.com/papercopilot/paperlists/main/aaai/aaai{year}.json"
 
+# Shared session: keep-alive TLS across years. requests negotiates
+# compression itself, only offering codecs it can actually decode
+_SESSION = requests.Session()
+
+# Local ETag cache: unchanged yearly JSON revalidates as a cheap 304
+_ETAG_CACHE_DIR = Path.home() / ".paperscout_cache" / "aaai"
+
+
+def _etag_cache_paths(year: str) -> Tuple[Path, Path]:
+    return (
+        _ETAG_CACHE_DIR / f"aaai{year}.json",
+        _ETAG_CACHE_DIR / f"aaai{year}.etag",
+    )
+
+
+def _store_etag_cache(year: str, content: bytes, etag: str) -> None:
+    """Best-effort: a failed cache write never breaks the fetch."""
+    try:
+        _ETAG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        body_path, etag_path = _etag_cache_paths(year)
+        body_path.write_bytes(content)
+        etag_path.write_text(etag)
+    except Exception:
+        pass
+
+
+def _note_from_item(item: Dict[str, Any], year: str) -> Dict[str, Any]:
+    """Flatten one Paper Copilot AAAI entry into the app's paper shape."""
+    # Parse authors (semicolon separated in source)
+    authors_str = item.get('author', '')
+    authors = [a.strip() for a in authors_str.split(';')] if authors_str else []
+
+    title = item.get('title', 'Untitled')
+    abstract = item.get('abstract', '')
+
+    return {
+        'id': item.get('id', 'unknown'),
+        'forum': item.get('id', 'unknown'),  # Use ID as forum
+        'title': title,
+        'abstract': abstract,
+        'authors': authors,
+        'keywords': [],  # Not usually in this JSON
+        'tldr': "",
+        'pdf': item.get('pdf', ''),
+        'venue': f'AAAI {year}',
+        'venue_id': f'AAAI.org/{year}/Conference',
+        'year': int(year),
+
+        # App defaults for missing scores
+        'avg_score': None,
+        'max_score': None,
+        'min_score': None,
+        'scored_review_count': 0,
+        'score_distribution': {},
+
+        # Lowercased search text, matching openreview_client ingest
+        '_title_lc': title.lower(),
+        '_abstract_lc': abstract.lower(),
+        '_keywords_lc': "",
+    }
+
+
 def fetch_aaai_from_github(year: str) -> List[Dict[str, Any]]:
     """
     Fetch AAAI papers for a specific year from Paper Copilot's GitHub repository.
@@ -14,48 +89,33 @@ def fetch_aaai_from_github(year: str) -> List[Dict[str, Any]]:
     url = AAAI_GITHUB_URL_TEMPLATE.format(year=year)
     try:
         print(f"Fetching AAAI {year} data from {url}...")
-        response = requests.get(url, timeout=30)
-        
-        if response.status_code == 404:
-             print(f"AAAI {year} data not found on GitHub.")
-             return []
-             
-        response.raise_for_status()
-        
-        data = response.json()
-        notes = []
-        
-        for item in data:
-            # Parse authors (semicolon separated in source)
-            authors_str = item.get('author', '')
-            authors = [a.strip() for a in authors_str.split(';')] if authors_str else []
-            
-            # Construct flattened paper dict matching openreview_client.py output
-            title = item.get('title', 'Untitled')
-            
-            # Map item fields to app expectation
-            note = {
-                'id': item.get('id', 'unknown'),
-                'forum': item.get('id', 'unknown'), # Use ID as forum
-                'title': title,
-                'abstract': item.get('abstract', ''),
-                'authors': authors,
-                'keywords': [], # Not usually in this JSON
-                'tldr': "",
-                'pdf': item.get('pdf', ''),
-                'venue': f'AAAI {year}',
-                'venue_id': f'AAAI.org/{year}/Conference',
-                'year': int(year),
-                
-                # App defaults for missing scores
-                'avg_score': None,
-                'max_score': None,
-                'min_score': None,
-                'scored_review_count': 0,
-                'score_distribution': {},
-            }
-            notes.append(note)
-            
+
+        body_path, etag_path = _etag_cache_paths(year)
+        headers = {}
+        if body_path.exists() and etag_path.exists():
+            headers["If-None-Match"] = etag_path.read_text().strip()
+
+        response = _SESSION.get(url, timeout=30, headers=headers)
+
+        if response.status_code == 304:
+            print(f"AAAI {year} data unchanged (304), using local copy.")
+            data = _loads(body_path.read_bytes())
+        elif response.status_code == 404:
+            print(f"AAAI {year} data not found on GitHub.")
+            return []
+        else:
+            response.raise_for_status()
+            # Parse the already-buffered bytes directly instead of going
+            # through response.json() (charset sniff + str decode copy),
+            # and hand the connection back to the pool right away
+            body = response.content
+            etag = response.headers.get("ETag")
+            response.close()
+            data = _loads(body)
+            if etag:
+                _store_etag_cache(year, body, etag)
+        notes = [_note_from_item(item, year) for item in data]
+
         print(f"Successfully fetched {len(notes)} AAAI {year} papers from GitHub.")
         return notes
         
@@ -63,6 +123,31 @@ def fetch_aaai_from_github(year: str) -> List[Dict[str, Any]]:
         print(f"Error fetching AAAI {year} data: {e}")
         return []
 
+def scrape_venue_range(years: Iterable[str]) -> List[Dict[str, Any]]:
+    """
+    Fetch several AAAI years concurrently and combine the results.
+
+    The downloads are network-bound, so overlapping them in a small
+    thread pool hides TLS handshake and transfer latency. Results are
+    combined in the order of the input years regardless of completion
+    order. (The Streamlit loader already parallelizes per venue/year,
+    so this is for callers fetching a range in one call.)
+    """
+    years = list(years)
+    if len(years) <= 1:
+        return fetch_aaai_from_github(years[0]) if years else []
+
+    by_year: Dict[str, List[Dict[str, Any]]] = {}
+    with ThreadPoolExecutor(max_workers=min(4, len(years))) as executor:
+        futures = {
+            executor.submit(fetch_aaai_from_github, year): year for year in years
+        }
+        for future in as_completed(futures):
+            by_year[futures[future]] = future.result()
+
+    return [note for year in years for note in by_year.get(year, [])]
+
+
 def scrape_venue(venue_id: str) -> List[Dict[str, Any]]:
     """
     Dispatcher for web-scraped venues.